@@ -3,7 +3,7 @@
 import os
 import sys
 import tempfile
-from typing import List, Optional
+from typing import List
 
 import streamlit as st
 
@@ -11,7 +11,7 @@ import streamlit as st
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.models import KnowledgeAtom
-from src.parser import DocumentParser, ParserError
+from src.parser import DocumentParser
 from src.markdown_parser import MarkdownParser
 from src.transformer import KnowledgeTransformer
 from src.statistics import compute_statistics
@@ -803,12 +803,8 @@ class KnowledgeAtomizerApp:
         """生成 Obsidian ZIP 数据"""
         try:
             exporter = ObsidianExporter()
-            result = exporter.export(atoms)
-            if result.success and result.file_path:
-                with open(result.file_path, 'rb') as f:
-                    st.session_state.zip_data = f.read()
-                os.unlink(result.file_path)
-                st.success("ZIP 生成完成！")
+            st.session_state.zip_data = exporter.export_to_bytes(atoms)
+            st.success("ZIP 生成完成！")
         except Exception as e:
             st.error(f"生成失败: {e}")
     
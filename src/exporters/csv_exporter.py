@@ -4,7 +4,7 @@ import csv
 import io
 import os
 import tempfile
-from typing import List
+from typing import BinaryIO, List
 
 from ..models import KnowledgeAtom, ExportResult
 from .base import BaseExporter
@@ -52,18 +52,13 @@ class CSVExporter(BaseExporter):
             )
         
         try:
-            # Generate CSV content
-            csv_content = self._generate_csv_content(atoms)
-            
             # Determine output path
             if output_path is None:
                 fd, output_path = tempfile.mkstemp(suffix='.csv')
                 os.close(fd)
             
-            # Write with UTF-8 BOM
             with open(output_path, 'wb') as f:
-                f.write(self.UTF8_BOM)
-                f.write(csv_content.encode('utf-8'))
+                self.export_to_stream(atoms, f)
             
             return ExportResult(
                 success=True,
@@ -79,6 +74,16 @@ class CSVExporter(BaseExporter):
                 file_path=None
             )
     
+    def export_to_stream(self, atoms: List[KnowledgeAtom], stream: BinaryIO) -> None:
+        """将 UTF-8 with BOM 编码的 CSV 写入二进制流
+        
+        Args:
+            atoms: List of KnowledgeAtom objects to export
+            stream: Writable binary stream, e.g. an open file or io.BytesIO
+        """
+        stream.write(self.UTF8_BOM)
+        stream.write(self._generate_csv_content(atoms).encode('utf-8'))
+    
     def _generate_csv_content(self, atoms: List[KnowledgeAtom]) -> str:
         """Generate CSV content as string.
         
@@ -134,23 +139,34 @@ class CSVExporter(BaseExporter):
         Returns:
             List of dictionaries with CSV data
         """
-        records = []
-        
         with open(file_path, 'rb') as f:
-            content = f.read()
-            
-            # Skip BOM if present
-            if content.startswith(CSVExporter.UTF8_BOM):
-                content = content[3:]
-            
-            # Decode and parse
-            text = content.decode('utf-8')
-            reader = csv.DictReader(io.StringIO(text))
+            return CSVExporter.parse_csv_stream(f)
+    
+    @staticmethod
+    def parse_csv_stream(stream: BinaryIO) -> List[dict]:
+        """Parse CSV data from a binary stream back into records.
+        
+        Args:
+            stream: Readable binary stream positioned at the start of the CSV
             
-            for row in reader:
-                # Convert level back to int
-                if 'level' in row:
-                    row['level'] = int(row['level'])
-                records.append(row)
+        Returns:
+            List of dictionaries with CSV data
+        """
+        records = []
+        content = stream.read()
+        
+        # Skip BOM if present
+        if content.startswith(CSVExporter.UTF8_BOM):
+            content = content[3:]
+        
+        # Decode and parse
+        text = content.decode('utf-8')
+        reader = csv.DictReader(io.StringIO(text))
+        
+        for row in reader:
+            # Convert level back to int
+            if 'level' in row:
+                row['level'] = int(row['level'])
+            records.append(row)
         
         return records
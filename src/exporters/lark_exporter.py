@@ -1,7 +1,7 @@
 """Lark (Feishu) Bitable Exporter for knowledge atoms."""
 
 import time
-from typing import List, Dict, Optional
+from typing import List, Optional
 
 import requests
 
@@ -6,12 +6,20 @@ import re
 import tempfile
 import zipfile
 from datetime import datetime
-from typing import List, Dict
+from functools import lru_cache
+from typing import BinaryIO, Dict, List, Union
 
 from ..models import KnowledgeAtom, ExportResult
 from .base import BaseExporter
 
 
+@lru_cache(maxsize=4096)
+def _source_tag_name(source_file: str) -> str:
+    """Tag-safe source name: extension dropped, non-word characters replaced."""
+    source_name = source_file.rsplit('.', 1)[0]
+    return re.sub(r'[^\w\u4e00-\u9fff]', '_', source_name)
+
+
 class ObsidianExporter(BaseExporter):
     """Obsidian 知识库导出器 - 生成 Markdown 文件并打包为 ZIP
     
@@ -22,15 +30,29 @@ class ObsidianExporter(BaseExporter):
     - 按层级组织的文件夹结构
     """
     
-    def export(self, atoms: List[KnowledgeAtom], output_path: str = None) -> ExportResult:
+    def __init__(self, compression: int = zipfile.ZIP_DEFLATED):
+        """初始化 Obsidian 导出器
+        
+        Args:
+            compression: ZIP 压缩方式 (zipfile.ZIP_DEFLATED 或 zipfile.ZIP_STORED)
+        """
+        self.compression = compression
+    
+    def export(
+        self, 
+        atoms: List[KnowledgeAtom], 
+        output_path: Union[str, BinaryIO, None] = None
+    ) -> ExportResult:
         """生成 Obsidian Markdown 文件并打包为 ZIP
         
         Args:
             atoms: List of KnowledgeAtom objects to export
-            output_path: Optional output ZIP file path. If None, creates a temp file.
+            output_path: Optional output ZIP file path or writable binary stream.
+                If None, creates a temp file.
             
         Returns:
-            ExportResult with success status and file path
+            ExportResult with success status, file path (None for streams)
+            and the names of the generated note files
         """
         if not atoms:
             return ExportResult(
@@ -41,44 +63,19 @@ class ObsidianExporter(BaseExporter):
             )
         
         try:
-            # Build atom lookup maps
-            atom_map = {atom.id: atom for atom in atoms}
-            
             # Determine output path
             if output_path is None:
                 fd, output_path = tempfile.mkstemp(suffix='.zip')
                 os.close(fd)
             
-            # Create ZIP file
-            used_filenames = set()
-            with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-                for atom in atoms:
-                    # Generate markdown content
-                    markdown = self._generate_markdown(atom, atoms, atom_map)
-                    
-                    # Create safe filename with deduplication
-                    base_filename = self._safe_filename(atom.title)
-                    filename = base_filename + '.md'
-                    
-                    # Handle duplicate filenames by appending atom id suffix
-                    if filename in used_filenames:
-                        # Use first 8 chars of UUID to make unique
-                        filename = f"{base_filename}_{atom.id[:8]}.md"
-                    
-                    used_filenames.add(filename)
-                    
-                    # Add to ZIP
-                    zf.writestr(filename, markdown.encode('utf-8'))
-                
-                # Generate MOC (Map of Content) index file
-                moc_content = self._generate_moc(atoms, atom_map)
-                zf.writestr('_MOC_知识地图.md', moc_content.encode('utf-8'))
+            file_names = self._write_zip(atoms, output_path)
             
             return ExportResult(
                 success=True,
                 message=f"成功导出 {len(atoms)} 个知识原子到 Obsidian 格式",
                 exported_count=len(atoms),
-                file_path=output_path
+                file_path=output_path if isinstance(output_path, str) else None,
+                file_names=file_names
             )
         except Exception as e:
             return ExportResult(
@@ -88,6 +85,69 @@ class ObsidianExporter(BaseExporter):
                 file_path=None
             )
     
+    def export_to_bytes(self, atoms: List[KnowledgeAtom]) -> bytes:
+        """生成 Obsidian Markdown 文件并在内存中打包为 ZIP
+        
+        Args:
+            atoms: List of KnowledgeAtom objects to export
+            
+        Returns:
+            The ZIP archive as bytes, or b'' when there are no atoms
+            (matching export(), which writes nothing in that case)
+        """
+        if not atoms:
+            return b''
+        
+        buf = io.BytesIO()
+        self._write_zip(atoms, buf)
+        return buf.getvalue()
+    
+    def _write_zip(self, atoms: List[KnowledgeAtom], target: Union[str, BinaryIO]) -> List[str]:
+        """Write the Markdown files and MOC index into a ZIP archive.
+        
+        Args:
+            atoms: List of KnowledgeAtom objects to export
+            target: Output file path or writable binary stream
+            
+        Returns:
+            Names of the per-atom note files, in atom order (MOC excluded)
+        """
+        # Build atom lookup maps
+        atom_map = {atom.id: atom for atom in atoms}
+        
+        used_filenames = set()
+        file_names = []
+        with zipfile.ZipFile(target, 'w', self.compression) as zf:
+            for atom in atoms:
+                # Generate markdown content
+                markdown = self._generate_markdown(atom, atoms, atom_map)
+                
+                # Create safe filename with deduplication
+                base_filename = self._safe_filename(atom.title)
+                filename = base_filename + '.md'
+                
+                # Handle duplicate filenames by appending atom id suffix
+                if filename in used_filenames:
+                    # Use first 8 chars of UUID to make unique
+                    filename = f"{base_filename}_{atom.id[:8]}.md"
+                    # Another atom may already be titled like the suffixed name
+                    counter = 2
+                    while filename in used_filenames:
+                        filename = f"{base_filename}_{atom.id[:8]}_{counter}.md"
+                        counter += 1
+                
+                used_filenames.add(filename)
+                file_names.append(filename)
+                
+                # Add to ZIP
+                zf.writestr(filename, markdown.encode('utf-8'))
+            
+            # Generate MOC (Map of Content) index file
+            moc_content = self._generate_moc(atoms, atom_map)
+            zf.writestr('_MOC_知识地图.md', moc_content.encode('utf-8'))
+        
+        return file_names
+    
     def _generate_markdown(
         self, 
         atom: KnowledgeAtom, 
@@ -196,9 +256,7 @@ class ObsidianExporter(BaseExporter):
         
         # 来源文件标签（去掉扩展名）
         if atom.source_file:
-            source_name = atom.source_file.rsplit('.', 1)[0]
-            safe_source = re.sub(r'[^\w\u4e00-\u9fff]', '_', source_name)
-            tags.append(f'来源/{safe_source}')
+            tags.append(f'来源/{_source_tag_name(atom.source_file)}')
         
         # 知识原子标签
         tags.append('知识原子')
@@ -371,11 +429,11 @@ class ObsidianExporter(BaseExporter):
         return value.replace('\\', '\\\\').replace('"', '\\"')
     
     @staticmethod
-    def read_zip_contents(zip_path: str) -> Dict[str, str]:
+    def read_zip_contents(zip_path: Union[str, BinaryIO]) -> Dict[str, str]:
         """Read all markdown files from a ZIP.
         
         Args:
-            zip_path: Path to ZIP file
+            zip_path: Path to ZIP file or readable binary stream
             
         Returns:
             Dict mapping filename to content
@@ -386,3 +444,15 @@ class ObsidianExporter(BaseExporter):
                 if name.endswith('.md'):
                     contents[name] = zf.read(name).decode('utf-8')
         return contents
+    
+    @staticmethod
+    def read_zip_contents_bytes(data: bytes) -> Dict[str, str]:
+        """Read all markdown files from an in-memory ZIP.
+        
+        Args:
+            data: ZIP archive bytes
+            
+        Returns:
+            Dict mapping filename to content
+        """
+        return ObsidianExporter.read_zip_contents(io.BytesIO(data))
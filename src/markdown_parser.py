@@ -2,11 +2,23 @@
 
 import re
 import uuid
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
 from .models import DocumentNode, DocumentTree, HeadingLevel
 
 
+# Path separators of either style, regardless of platform
+_PATH_SEP_PATTERN = re.compile(r'[\\/]')
+
+
+@lru_cache(maxsize=4096)
+def _derive_source_name(path: str) -> str:
+    """Extract the file name from a path using either / or \\ separators."""
+    # Split on separators only, so a drive-like "a:" prefix stays in the name
+    return _PATH_SEP_PATTERN.split(path)[-1]
+
+
 class MarkdownParser:
     """Markdown 文档解析器
     
@@ -42,10 +54,7 @@ class MarkdownParser:
             DocumentTree 结构
         """
         # Extract filename from path
-        if '/' in source_file:
-            source_file = source_file.split('/')[-1]
-        if '\\' in source_file:
-            source_file = source_file.split('\\')[-1]
+        source_file = _derive_source_name(source_file)
         
         # Split content into sections by headings
         sections = self._split_by_headings(content)
@@ -146,10 +155,8 @@ class MarkdownParser:
             else:
                 root_nodes.append(node)
             
-            # Update stack
+            # Update stack and clear deeper levels
             stack[level - 1] = node
-            # Clear deeper levels
-            for i in range(level, 6):
-                stack[i] = None
+            stack[level:] = [None] * (6 - level)
         
         return root_nodes
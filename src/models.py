@@ -87,3 +87,4 @@ class ExportResult:
     message: str
     exported_count: int
     file_path: Optional[str] = None
+    file_names: List[str] = field(default_factory=list)  # 导出的文件名（如 Obsidian 笔记）
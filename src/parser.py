@@ -1,9 +1,9 @@
 """Document Parser for Word documents."""
 
 import os
-import re
 import uuid
-from typing import List, Optional
+from itertools import chain
+from typing import BinaryIO, List, Optional, Union
 
 from docx import Document
 from docx.table import Table
@@ -12,6 +12,14 @@ from docx.text.paragraph import Paragraph
 from .models import DocumentNode, DocumentTree, HeadingLevel
 
 
+# WordprocessingML namespace and the element/attribute tags looked up per paragraph
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_P_TAG = _W_NS + 'p'
+_TBL_TAG = _W_NS + 'tbl'
+_OUTLINE_TAG = _W_NS + 'outlineLvl'
+_VAL_ATTR = _W_NS + 'val'
+
+
 class ParserError(Exception):
     """Base exception for parser errors."""
     pass
@@ -49,11 +57,12 @@ class DocumentParser:
         '标题 5': HeadingLevel.H5,
     }
     
-    def parse(self, file_path: str) -> DocumentTree:
+    def parse(self, file_path: Union[str, BinaryIO]) -> DocumentTree:
         """解析 Word 文档，返回文档树
         
         Args:
-            file_path: Path to the .docx file
+            file_path: Path to the .docx file, or a readable binary stream
+                containing one (path and extension checks are skipped)
             
         Returns:
             DocumentTree containing the parsed structure
@@ -63,16 +72,22 @@ class DocumentParser:
             InvalidFileFormatError: If file is not a valid .docx
             CorruptedDocumentError: If document is corrupted
         """
-        # Validate file exists
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"文件不存在: {file_path}")
-        
-        # Validate file extension
-        if not file_path.lower().endswith('.docx'):
-            raise InvalidFileFormatError(
-                f"不支持的文件格式: {os.path.splitext(file_path)[1]}。"
-                f"请上传 .docx 格式的文件。"
-            )
+        if isinstance(file_path, str):
+            # Validate file exists
+            if not os.path.exists(file_path):
+                raise FileNotFoundError(f"文件不存在: {file_path}")
+            
+            # Validate file extension
+            if not file_path.lower().endswith('.docx'):
+                raise InvalidFileFormatError(
+                    f"不支持的文件格式: {os.path.splitext(file_path)[1]}。"
+                    f"请上传 .docx 格式的文件。"
+                )
+            
+            source_file = os.path.basename(file_path)
+        else:
+            # Streams opened from files carry their path in .name
+            source_file = os.path.basename(getattr(file_path, 'name', '') or 'unknown.docx')
         
         # Try to open and parse the document
         try:
@@ -82,7 +97,6 @@ class DocumentParser:
                 f"文档损坏或无法解析: {str(e)}。请尝试重新导出文档。"
             )
         
-        source_file = os.path.basename(file_path)
         root_nodes = self._build_tree(doc)
         
         return DocumentTree(source_file=source_file, root_nodes=root_nodes)
@@ -98,7 +112,7 @@ class DocumentParser:
         
         for element in doc.element.body:
             # Check if element is a paragraph
-            if element.tag.endswith('p'):
+            if element.tag == _P_TAG:
                 para = Paragraph(element, doc)
                 level = self._extract_heading_level(para)
                 text = para.text.strip()
@@ -132,11 +146,9 @@ class DocumentParser:
                     else:
                         root_nodes.append(new_node)
                     
-                    # Update level stack
+                    # Update level stack and clear lower levels
                     level_stack[level_value] = new_node
-                    # Clear lower levels
-                    for i in range(level_value + 1, 6):
-                        level_stack[i] = None
+                    level_stack[level_value + 1:] = [None] * (5 - level_value)
                     
                     current_node = new_node
                 else:
@@ -146,7 +158,7 @@ class DocumentParser:
                         current_content_parts.append(formatted_text)
             
             # Check if element is a table
-            elif element.tag.endswith('tbl'):
+            elif element.tag == _TBL_TAG:
                 table = Table(element, doc)
                 markdown_table = self._convert_table_to_markdown(table)
                 if markdown_table:
@@ -167,22 +179,24 @@ class DocumentParser:
         Returns:
             HeadingLevel enum value
         """
+        p_pr = paragraph._p.pPr
+        
+        # Paragraphs without properties use the default style and carry no
+        # outline level, so skip the (comparatively slow) style lookup
+        if p_pr is None:
+            return HeadingLevel.BODY
+        
         style_name = paragraph.style.name if paragraph.style else None
         
         if style_name in self.HEADING_STYLE_MAP:
             return self.HEADING_STYLE_MAP[style_name]
         
         # Also check for outline level in paragraph properties
-        if paragraph._p.pPr is not None:
-            outline_lvl = paragraph._p.pPr.find(
-                '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}outlineLvl'
-            )
-            if outline_lvl is not None:
-                level = int(outline_lvl.get(
-                    '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val'
-                ))
-                if 0 <= level <= 4:
-                    return HeadingLevel(level + 1)
+        outline_lvl = p_pr.find(_OUTLINE_TAG)
+        if outline_lvl is not None:
+            level = int(outline_lvl.get(_VAL_ATTR))
+            if 0 <= level <= 4:
+                return HeadingLevel(level + 1)
         
         return HeadingLevel.BODY
     
@@ -232,23 +246,16 @@ class DocumentParser:
         if not rows_data:
             return ''
         
-        # Build Markdown table
-        lines = []
-        
-        # Header row
-        header = '| ' + ' | '.join(rows_data[0]) + ' |'
-        lines.append(header)
-        
-        # Separator row
-        separator = '| ' + ' | '.join(['---'] * len(rows_data[0])) + ' |'
-        lines.append(separator)
+        n_cols = len(rows_data[0])
+        separator = '| ' + ' | '.join(['---'] * n_cols) + ' |'
         
-        # Data rows
-        for row in rows_data[1:]:
-            # Pad row if needed
-            while len(row) < len(rows_data[0]):
-                row.append('')
-            line = '| ' + ' | '.join(row) + ' |'
-            lines.append(line)
+        def format_row(row: List[str]) -> str:
+            # Pad short rows to the header's column count
+            padding = [''] * (n_cols - len(row))
+            return '| ' + ' | '.join(row + padding) + ' |'
         
-        return '\n'.join(lines)
+        # Header row, separator row, then data rows
+        return '\n'.join(chain(
+            (format_row(rows_data[0]), separator),
+            map(format_row, rows_data[1:])
+        ))
@@ -0,0 +1,19 @@
+"""Shared Hypothesis configuration for property-based tests.
+
+Select a profile with the HYPOTHESIS_PROFILE environment variable:
+"dev" (default) for quick local iteration, "ci" for thorough runs.
+"""
+
+import os
+
+from hypothesis import HealthCheck, settings
+
+
+settings.register_profile(
+    "ci",
+    max_examples=200,
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow]
+)
+settings.register_profile("dev", max_examples=20)
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "dev"))
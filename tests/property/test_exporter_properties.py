@@ -3,64 +3,23 @@
 Feature: knowledge-atomizer
 """
 
-import os
-import tempfile
+import io
 import uuid
 from typing import List
 
-from hypothesis import given, settings, strategies as st
-
-import sys
-sys.path.insert(0, '.')
+from hypothesis import given, strategies as st
 
 from src.models import KnowledgeAtom
 from src.exporters.csv_exporter import CSVExporter
 
+from .strategies import atom_id, knowledge_atom_strategy, unicode_title
 
-# Strategies for generating KnowledgeAtom objects
-valid_uuid = st.builds(lambda: str(uuid.uuid4()))
-# Use printable characters only to avoid YAML parsing issues
-valid_title = st.text(
-    min_size=1, 
-    max_size=50, 
-    alphabet=st.characters(whitelist_categories=('L', 'N', 'P', 'S'), whitelist_characters=' ')
-).filter(lambda x: x.strip())
-valid_content = st.text(
-    max_size=200,
-    alphabet=st.characters(whitelist_categories=('L', 'N', 'P', 'S', 'Z'), whitelist_characters=' \n')
-)
-valid_level = st.integers(min_value=1, max_value=5)
-valid_source_file = st.text(
-    min_size=1, 
-    max_size=30, 
-    alphabet=st.characters(whitelist_categories=('L', 'N'), whitelist_characters='_-')
-).filter(lambda x: x.strip()).map(lambda x: x + ".docx")
-
-
-@st.composite
-def knowledge_atom_strategy(draw):
-    """Generate a valid KnowledgeAtom."""
-    return KnowledgeAtom(
-        id=draw(valid_uuid),
-        title=draw(valid_title),
-        content=draw(valid_content),
-        level=draw(valid_level),
-        parent_id=draw(st.one_of(st.none(), valid_uuid)),
-        parent_title=draw(st.one_of(st.none(), valid_title)),
-        source_file=draw(valid_source_file),
-        children_ids=draw(st.lists(valid_uuid, max_size=3)),
-        path=draw(valid_title)  # path field
-    )
 
+# Exporters are stateless, so share one instance across all examples
+_CSV_EXPORTER = CSVExporter()
 
-@st.composite
-def knowledge_atom_list_strategy(draw, min_size=1, max_size=10):
-    """Generate a list of KnowledgeAtoms."""
-    return draw(st.lists(knowledge_atom_strategy(), min_size=min_size, max_size=max_size))
 
-
-@given(atoms=knowledge_atom_list_strategy())
-@settings(max_examples=100)
+@given(atoms=st.lists(knowledge_atom_strategy(), min_size=1, max_size=10, unique_by=atom_id))
 def test_csv_round_trip_consistency(atoms: List[KnowledgeAtom]):
     """
     Feature: knowledge-atomizer
@@ -71,57 +30,53 @@ def test_csv_round_trip_consistency(atoms: List[KnowledgeAtom]):
     back SHALL produce records with equivalent id, title, content, level,
     parent_id, parent_title, and source_file values.
     """
-    exporter = CSVExporter()
+    exporter = _CSV_EXPORTER
     
-    # Export to CSV
-    result = exporter.export(atoms)
-    assert result.success, f"Export should succeed: {result.message}"
-    assert result.file_path is not None, "File path should be set"
+    # Export to an in-memory CSV
+    buf = io.BytesIO()
+    exporter.export_to_stream(atoms, buf)
+    buf.seek(0)
+    
+    # Parse CSV back
+    records = CSVExporter.parse_csv_stream(buf)
     
-    try:
-        # Parse CSV back
-        records = CSVExporter.parse_csv(result.file_path)
+    # Verify count matches
+    assert len(records) == len(atoms), \
+        f"Expected {len(atoms)} records, got {len(records)}"
+    
+    # Verify each record matches original atom
+    for atom, record in zip(atoms, records):
+        assert record['id'] == atom.id, \
+            f"id mismatch: expected {atom.id}, got {record['id']}"
+        
+        assert record['title'] == atom.title, \
+            f"title mismatch: expected {atom.title}, got {record['title']}"
+        
+        assert record['content'] == (atom.content or ''), \
+            f"content mismatch: expected {atom.content}, got {record['content']}"
+        
+        assert record['level'] == atom.level, \
+            f"level mismatch: expected {atom.level}, got {record['level']}"
+        
+        expected_parent_id = atom.parent_id or ''
+        assert record['parent_id'] == expected_parent_id, \
+            f"parent_id mismatch: expected {expected_parent_id}, got {record['parent_id']}"
         
-        # Verify count matches
-        assert len(records) == len(atoms), \
-            f"Expected {len(atoms)} records, got {len(records)}"
+        expected_parent_title = atom.parent_title or ''
+        assert record['parent_title'] == expected_parent_title, \
+            f"parent_title mismatch: expected {expected_parent_title}, got {record['parent_title']}"
         
-        # Verify each record matches original atom
-        for atom, record in zip(atoms, records):
-            assert record['id'] == atom.id, \
-                f"id mismatch: expected {atom.id}, got {record['id']}"
-            
-            assert record['title'] == atom.title, \
-                f"title mismatch: expected {atom.title}, got {record['title']}"
-            
-            assert record['content'] == (atom.content or ''), \
-                f"content mismatch: expected {atom.content}, got {record['content']}"
-            
-            assert record['level'] == atom.level, \
-                f"level mismatch: expected {atom.level}, got {record['level']}"
-            
-            expected_parent_id = atom.parent_id or ''
-            assert record['parent_id'] == expected_parent_id, \
-                f"parent_id mismatch: expected {expected_parent_id}, got {record['parent_id']}"
-            
-            expected_parent_title = atom.parent_title or ''
-            assert record['parent_title'] == expected_parent_title, \
-                f"parent_title mismatch: expected {expected_parent_title}, got {record['parent_title']}"
-            
-            assert record['source_file'] == atom.source_file, \
-                f"source_file mismatch: expected {atom.source_file}, got {record['source_file']}"
-            
-            expected_path = atom.path or ''
-            assert record.get('path', '') == expected_path, \
-                f"path mismatch: expected {expected_path}, got {record.get('path', '')}"
-    finally:
-        # Cleanup
-        if result.file_path and os.path.exists(result.file_path):
-            os.unlink(result.file_path)
+        assert record['source_file'] == atom.source_file, \
+            f"source_file mismatch: expected {atom.source_file}, got {record['source_file']}"
+        
+        expected_path = atom.path or ''
+        assert record.get('path', '') == expected_path, \
+            f"path mismatch: expected {expected_path}, got {record.get('path', '')}"
 
 
-@given(atoms=knowledge_atom_list_strategy())
-@settings(max_examples=100)
+@given(atoms=st.lists(
+    knowledge_atom_strategy(title=unicode_title), min_size=1, max_size=3, unique_by=atom_id
+))
 def test_csv_utf8_bom_encoding(atoms: List[KnowledgeAtom]):
     """
     Feature: knowledge-atomizer
@@ -131,34 +86,41 @@ def test_csv_utf8_bom_encoding(atoms: List[KnowledgeAtom]):
     For any exported CSV file, the first three bytes SHALL be the UTF-8 BOM
     (0xEF, 0xBB, 0xBF).
     """
-    exporter = CSVExporter()
+    exporter = _CSV_EXPORTER
     
-    # Export to CSV
-    result = exporter.export(atoms)
-    assert result.success, f"Export should succeed: {result.message}"
-    assert result.file_path is not None, "File path should be set"
+    # Export to an in-memory CSV
+    buf = io.BytesIO()
+    exporter.export_to_stream(atoms, buf)
     
-    try:
-        # Read first 3 bytes
-        with open(result.file_path, 'rb') as f:
-            first_bytes = f.read(3)
-        
-        expected_bom = b'\xef\xbb\xbf'
-        assert first_bytes == expected_bom, \
-            f"First 3 bytes should be UTF-8 BOM {expected_bom}, got {first_bytes}"
-    finally:
-        # Cleanup
-        if result.file_path and os.path.exists(result.file_path):
-            os.unlink(result.file_path)
+    # Check first 3 bytes
+    first_bytes = buf.getvalue()[:3]
+    
+    expected_bom = b'\xef\xbb\xbf'
+    assert first_bytes == expected_bom, \
+        f"First 3 bytes should be UTF-8 BOM {expected_bom}, got {first_bytes}"
 
 
 import re
+import zipfile
 import yaml
 from src.exporters.obsidian_exporter import ObsidianExporter
 
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Tests don't verify compression; storing skips deflate/inflate per example
+_OBS_EXPORTER = ObsidianExporter(compression=zipfile.ZIP_STORED)
 
-@given(atoms=knowledge_atom_list_strategy())
-@settings(max_examples=100)
+# Patterns applied to every exported file of every example
+_FRONTMATTER_RE = re.compile(r'^---\n(.*?)\n---', re.DOTALL)
+_TITLE_RE = re.compile(r'^# (.+)$', re.MULTILINE)
+
+
+@given(atoms=st.lists(knowledge_atom_strategy(), min_size=1, max_size=3, unique_by=atom_id))
 def test_obsidian_frontmatter_validity(atoms: List[KnowledgeAtom]):
     """
     Feature: knowledge-atomizer
@@ -168,47 +130,39 @@ def test_obsidian_frontmatter_validity(atoms: List[KnowledgeAtom]):
     For any KnowledgeAtom, the generated Markdown file SHALL contain valid
     YAML frontmatter with fields: title, level, parent (if applicable), and source.
     """
-    exporter = ObsidianExporter()
+    exporter = _OBS_EXPORTER
     
-    # Export to ZIP
-    result = exporter.export(atoms)
-    assert result.success, f"Export should succeed: {result.message}"
-    assert result.file_path is not None, "File path should be set"
+    # Export to an in-memory ZIP
+    data = exporter.export_to_bytes(atoms)
     
-    try:
-        # Read ZIP contents
-        contents = ObsidianExporter.read_zip_contents(result.file_path)
+    # Read ZIP contents
+    contents = ObsidianExporter.read_zip_contents_bytes(data)
+    
+    # Verify each file has valid frontmatter
+    for filename, content in contents.items():
+        # Extract frontmatter
+        match = _FRONTMATTER_RE.match(content)
+        assert match, f"File {filename} should have YAML frontmatter"
+        
+        frontmatter_text = match.group(1)
         
-        # Verify each file has valid frontmatter
-        for filename, content in contents.items():
-            # Extract frontmatter
-            match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
-            assert match, f"File {filename} should have YAML frontmatter"
-            
-            frontmatter_text = match.group(1)
-            
-            # Parse YAML
-            try:
-                frontmatter = yaml.safe_load(frontmatter_text)
-            except yaml.YAMLError as e:
-                assert False, f"File {filename} has invalid YAML: {e}"
-            
-            # Verify required fields
-            assert 'title' in frontmatter, f"File {filename} should have 'title' field"
-            assert 'level' in frontmatter, f"File {filename} should have 'level' field"
-            assert 'source' in frontmatter, f"File {filename} should have 'source' field"
-            
-            # Verify level is valid
-            assert 1 <= frontmatter['level'] <= 5, \
-                f"File {filename} level should be 1-5, got {frontmatter['level']}"
-    finally:
-        # Cleanup
-        if result.file_path and os.path.exists(result.file_path):
-            os.unlink(result.file_path)
+        # Parse YAML
+        try:
+            frontmatter = yaml.load(frontmatter_text, Loader=_YamlLoader)
+        except yaml.YAMLError as e:
+            assert False, f"File {filename} has invalid YAML: {e}"
+        
+        # Verify required fields
+        assert 'title' in frontmatter, f"File {filename} should have 'title' field"
+        assert 'level' in frontmatter, f"File {filename} should have 'level' field"
+        assert 'source' in frontmatter, f"File {filename} should have 'source' field"
+        
+        # Verify level is valid
+        assert 1 <= frontmatter['level'] <= 5, \
+            f"File {filename} level should be 1-5, got {frontmatter['level']}"
 
 
-@given(atoms=knowledge_atom_list_strategy(min_size=2, max_size=5))
-@settings(max_examples=100)
+@given(atoms=st.lists(knowledge_atom_strategy(), min_size=2, max_size=5, unique_by=atom_id))
 def test_obsidian_bidirectional_links(atoms: List[KnowledgeAtom]):
     """
     Feature: knowledge-atomizer
@@ -233,53 +187,50 @@ def test_obsidian_bidirectional_links(atoms: List[KnowledgeAtom]):
             children_ids=atoms[1].children_ids
         )
     
-    exporter = ObsidianExporter()
+    exporter = _OBS_EXPORTER
     
-    # Export to ZIP
-    result = exporter.export(atoms)
-    assert result.success, f"Export should succeed: {result.message}"
+    # Export to an in-memory ZIP
+    data = exporter.export_to_bytes(atoms)
     
-    try:
-        # Read ZIP contents
-        contents = ObsidianExporter.read_zip_contents(result.file_path)
+    # Read ZIP contents
+    contents = ObsidianExporter.read_zip_contents_bytes(data)
+    
+    # Build lookup maps once per example
+    atom_by_title = {atom.title: atom for atom in atoms}
+    atom_by_id = {atom.id: atom for atom in atoms}
+    children_by_parent = {}
+    for a in atoms:
+        children_by_parent.setdefault(a.parent_id, []).append(a)
+    
+    # Check each file
+    for filename, content in contents.items():
+        # Find which atom this file is for
+        title_match = _TITLE_RE.search(content)
+        if not title_match:
+            continue
         
-        # Build atom map by title for lookup
-        atom_by_title = {atom.title: atom for atom in atoms}
+        title = title_match.group(1)
+        atom = atom_by_title.get(title)
+        if not atom:
+            continue
         
-        # Check each file
-        for filename, content in contents.items():
-            # Find which atom this file is for
-            title_match = re.search(r'^# (.+)$', content, re.MULTILINE)
-            if not title_match:
-                continue
-            
-            title = title_match.group(1)
-            atom = atom_by_title.get(title)
-            if not atom:
-                continue
-            
-            # If atom has parent, check for parent link
-            if atom.parent_id:
-                parent_atom = next((a for a in atoms if a.id == atom.parent_id), None)
-                if parent_atom:
-                    expected_link = f"[[{parent_atom.title}]]"
-                    assert expected_link in content, \
-                        f"File for '{title}' should contain parent link {expected_link}"
-            
-            # Check for children links
-            children = [a for a in atoms if a.parent_id == atom.id]
-            for child in children:
-                expected_link = f"[[{child.title}]]"
+        # If atom has parent, check for parent link
+        if atom.parent_id:
+            parent_atom = atom_by_id.get(atom.parent_id)
+            if parent_atom:
+                expected_link = f"[[{parent_atom.title}]]"
                 assert expected_link in content, \
-                    f"File for '{title}' should contain child link {expected_link}"
-    finally:
-        # Cleanup
-        if result.file_path and os.path.exists(result.file_path):
-            os.unlink(result.file_path)
+                    f"File for '{title}' should contain parent link {expected_link}"
+        
+        # Check for children links
+        children = children_by_parent.get(atom.id, [])
+        for child in children:
+            expected_link = f"[[{child.title}]]"
+            assert expected_link in content, \
+                f"File for '{title}' should contain child link {expected_link}"
 
 
-@given(atoms=knowledge_atom_list_strategy())
-@settings(max_examples=100)
+@given(atoms=st.lists(knowledge_atom_strategy(), min_size=1, max_size=3, unique_by=atom_id))
 def test_obsidian_file_count(atoms: List[KnowledgeAtom]):
     """
     Feature: knowledge-atomizer
@@ -289,22 +240,48 @@ def test_obsidian_file_count(atoms: List[KnowledgeAtom]):
     For any list of N KnowledgeAtoms, the ObsidianExporter SHALL generate
     exactly N Markdown files.
     """
-    exporter = ObsidianExporter()
+    exporter = _OBS_EXPORTER
     
-    # Export to ZIP
-    result = exporter.export(atoms)
+    # Export to an in-memory ZIP; the result lists the notes it wrote
+    result = exporter.export(atoms, io.BytesIO())
     assert result.success, f"Export should succeed: {result.message}"
     assert result.exported_count == len(atoms), \
         f"Exported count should be {len(atoms)}, got {result.exported_count}"
     
-    try:
-        # Read ZIP contents
-        contents = ObsidianExporter.read_zip_contents(result.file_path)
-        
-        # Verify file count
-        assert len(contents) == len(atoms), \
-            f"Expected {len(atoms)} files, got {len(contents)}"
-    finally:
-        # Cleanup
-        if result.file_path and os.path.exists(result.file_path):
-            os.unlink(result.file_path)
+    # Verify file count: one distinct note per atom, so no ZIP entry is
+    # overwritten by a duplicate name
+    assert len(set(result.file_names)) == len(atoms), \
+        f"Expected {len(atoms)} distinct files, got {sorted(result.file_names)}"
+
+
+def test_obsidian_file_names_unique_on_suffix_collision():
+    """
+    Test that a title equal to another atom's suffixed name does not collide.
+    Validates: Requirements 4.1
+    """
+    ids = [str(uuid.UUID(int=i, version=4)) for i in range(3)]
+    titles = [f"x_{ids[2][:8]}", "x", "x"]
+    atoms = [
+        KnowledgeAtom(
+            id=aid, title=title, content="", level=1, parent_id=None,
+            parent_title=None, source_file="doc.docx", children_ids=[], path=title
+        )
+        for aid, title in zip(ids, titles)
+    ]
+    
+    result = _OBS_EXPORTER.export(atoms, io.BytesIO())
+    
+    assert len(set(result.file_names)) == len(atoms), \
+        f"Expected {len(atoms)} distinct files, got {result.file_names}"
+
+
+def test_obsidian_empty_export_agrees():
+    """
+    Test that both Obsidian entry points produce nothing for an empty list.
+    Validates: Requirements 4.1
+    """
+    result = _OBS_EXPORTER.export([], io.BytesIO())
+    assert result.success
+    assert result.exported_count == 0
+    
+    assert _OBS_EXPORTER.export_to_bytes([]) == b''
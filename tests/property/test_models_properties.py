@@ -6,23 +6,26 @@ Validates: Requirements 2.2
 """
 
 import uuid
-from hypothesis import given, settings, strategies as st
 
-import sys
-sys.path.insert(0, '.')
+import pytest
+from hypothesis import given, strategies as st
 
 from src.models import KnowledgeAtom
 
+from .strategies import (
+    foreign_uuid,
+    valid_content,
+    valid_level,
+    valid_source_file,
+    valid_title,
+    valid_uuid,
+)
+
 
 # Custom strategies for generating valid KnowledgeAtom fields
-valid_uuid = st.builds(lambda: str(uuid.uuid4()))
-valid_title = st.text(min_size=1, max_size=100).filter(lambda x: x.strip())
-valid_content = st.text(max_size=1000)
-valid_level = st.integers(min_value=1, max_value=5)
-valid_source_file = st.text(min_size=1, max_size=100).filter(lambda x: x.strip())
-optional_uuid = st.one_of(st.none(), valid_uuid)
+optional_uuid = st.one_of(st.none(), foreign_uuid)
 optional_title = st.one_of(st.none(), valid_title)
-children_ids = st.lists(valid_uuid, max_size=10)
+children_ids = st.lists(foreign_uuid, max_size=2)
 
 
 @given(
@@ -35,7 +38,6 @@ children_ids = st.lists(valid_uuid, max_size=10)
     source_file=valid_source_file,
     children_ids=children_ids
 )
-@settings(max_examples=100)
 def test_atom_field_completeness_valid_atoms(
     id: str,
     title: str,
@@ -66,43 +68,28 @@ def test_atom_field_completeness_valid_atoms(
         children_ids=children_ids
     )
     
-    # Verify the atom passes validation
+    # Verify the atom passes validation (includes parsing id as a UUID)
     assert atom.is_valid(), f"Valid atom should pass validation: {atom}"
     
     # Verify individual field constraints
     assert atom.id is not None, "id should not be None"
-    uuid.UUID(atom.id)  # Should not raise
     
     assert atom.title is not None and atom.title.strip(), "title should be non-empty"
     assert 1 <= atom.level <= 5, f"level should be 1-5, got {atom.level}"
     assert atom.source_file is not None and atom.source_file.strip(), "source_file should be non-empty"
 
 
-# Strategies for invalid atoms
-invalid_uuid = st.one_of(
-    st.just(""),
-    st.just("not-a-uuid"),
-    st.just("12345"),
-    st.none()
-)
-invalid_title = st.one_of(
-    st.just(""),
-    st.just("   "),
-    st.just("\t\n")
-)
+# Invalid atom fields; fixed samples are enumerated, only levels are fuzzed
+invalid_uuids = ["", "not-a-uuid", "12345", None]
+invalid_titles = ["", "   ", "\t\n"]
 invalid_level = st.one_of(
     st.integers(max_value=0),
     st.integers(min_value=6)
 )
-invalid_source_file = st.one_of(
-    st.just(""),
-    st.just("   "),
-    st.just("\t\n")
-)
+invalid_source_files = ["", "   ", "\t\n"]
 
 
-@given(invalid_id=invalid_uuid)
-@settings(max_examples=100)
+@pytest.mark.parametrize("invalid_id", invalid_uuids)
 def test_atom_rejects_invalid_uuid(invalid_id):
     """
     Feature: knowledge-atomizer
@@ -125,8 +112,7 @@ def test_atom_rejects_invalid_uuid(invalid_id):
     assert not atom.is_valid(), f"Atom with invalid UUID should fail validation: {invalid_id}"
 
 
-@given(invalid_title=invalid_title)
-@settings(max_examples=100)
+@pytest.mark.parametrize("invalid_title", invalid_titles)
 def test_atom_rejects_invalid_title(invalid_title):
     """
     Feature: knowledge-atomizer
@@ -150,7 +136,6 @@ def test_atom_rejects_invalid_title(invalid_title):
 
 
 @given(invalid_level=invalid_level)
-@settings(max_examples=100)
 def test_atom_rejects_invalid_level(invalid_level):
     """
     Feature: knowledge-atomizer
@@ -173,8 +158,7 @@ def test_atom_rejects_invalid_level(invalid_level):
     assert not atom.is_valid(), f"Atom with invalid level should fail validation: {invalid_level}"
 
 
-@given(invalid_source=invalid_source_file)
-@settings(max_examples=100)
+@pytest.mark.parametrize("invalid_source", invalid_source_files)
 def test_atom_rejects_invalid_source_file(invalid_source):
     """
     Feature: knowledge-atomizer
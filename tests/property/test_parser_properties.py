@@ -3,34 +3,45 @@
 Feature: knowledge-atomizer
 """
 
+import io
 import os
 import tempfile
 import uuid
 from typing import List, Tuple
 
+import pytest
 from docx import Document
-from docx.shared import Pt
-from hypothesis import given, settings, strategies as st, assume
-
-import sys
-sys.path.insert(0, '.')
+from hypothesis import given, strategies as st
 
 from src.parser import DocumentParser, InvalidFileFormatError, FileNotFoundError
-from src.models import HeadingLevel, DocumentNode
+from src.models import DocumentNode
+
+from .strategies import ascii_alnum_space, heading_entry, heading_list
+
+
+# Empty document saved once; each example loads it from memory instead of
+# re-reading python-docx's default template from disk
+def _empty_document_bytes() -> bytes:
+    buf = io.BytesIO()
+    Document().save(buf)
+    return buf.getvalue()
+
+
+_TEMPLATE_BYTES = _empty_document_bytes()
 
 
 # Helper to create test documents
-def create_test_document(headings: List[Tuple[int, str]], paragraphs_per_heading: int = 0) -> str:
-    """Create a test .docx file with specified headings.
+def create_test_document(headings: List[Tuple[int, str]], paragraphs_per_heading: int = 0) -> io.BytesIO:
+    """Create an in-memory test .docx with specified headings.
     
     Args:
         headings: List of (level, title) tuples where level is 1-5
         paragraphs_per_heading: Number of body paragraphs to add after each heading
         
     Returns:
-        Path to the created temporary file
+        In-memory .docx stream positioned at the start
     """
-    doc = Document()
+    doc = Document(io.BytesIO(_TEMPLATE_BYTES))
     
     for level, title in headings:
         # Add heading
@@ -40,26 +51,24 @@ def create_test_document(headings: List[Tuple[int, str]], paragraphs_per_heading
         for i in range(paragraphs_per_heading):
             doc.add_paragraph(f"Content paragraph {i+1} under {title}")
     
-    # Save to temp file
-    fd, path = tempfile.mkstemp(suffix='.docx')
-    os.close(fd)
-    doc.save(path)
-    return path
-
+    buf = io.BytesIO()
+    doc.save(buf)
+    buf.seek(0)
+    return buf
 
-# Strategies for generating heading structures
-heading_level = st.integers(min_value=1, max_value=5)
-heading_title = st.text(min_size=1, max_size=50, alphabet=st.characters(
-    whitelist_categories=('L', 'N', 'P', 'S'),
-    whitelist_characters=' '
-)).filter(lambda x: x.strip())
 
-heading_entry = st.tuples(heading_level, heading_title)
-heading_list = st.lists(heading_entry, min_size=1, max_size=10)
+def collect_nodes(roots: List[DocumentNode]) -> List[DocumentNode]:
+    """Collect all nodes in pre-order using an explicit stack."""
+    result = []
+    stack = list(reversed(roots))
+    while stack:
+        node = stack.pop()
+        result.append(node)
+        stack.extend(reversed(node.children))
+    return result
 
 
 @given(headings=heading_list)
-@settings(max_examples=100)
 def test_heading_level_recognition(headings: List[Tuple[int, str]]):
     """
     Feature: knowledge-atomizer
@@ -70,44 +79,30 @@ def test_heading_level_recognition(headings: List[Tuple[int, str]]):
     the Parser SHALL correctly identify and return the corresponding HeadingLevel
     (H1-H5) for each heading.
     """
-    # Filter out empty titles after strip
-    headings = [(level, title.strip()) for level, title in headings if title.strip()]
-    assume(len(headings) > 0)
-    
     # Make titles unique by appending index to avoid duplicate title issues
     unique_headings = [(level, f"{title}_{i}") for i, (level, title) in enumerate(headings)]
     
     # Create test document
-    path = create_test_document(unique_headings)
+    doc_stream = create_test_document(unique_headings)
     
-    try:
-        parser = DocumentParser()
-        tree = parser.parse(path)
-        
-        # Collect all nodes from tree in order (pre-order traversal)
-        def collect_nodes(nodes: List[DocumentNode]) -> List[DocumentNode]:
-            result = []
-            for node in nodes:
-                result.append(node)
-                result.extend(collect_nodes(node.children))
-            return result
-        
-        all_nodes = collect_nodes(tree.root_nodes)
-        
-        # Verify we got the right number of headings
-        assert len(all_nodes) == len(unique_headings), \
-            f"Expected {len(unique_headings)} nodes, got {len(all_nodes)}"
-        
-        # Verify each heading level is correctly identified by title
-        title_to_level = {title: level for level, title in unique_headings}
-        
-        for node in all_nodes:
-            expected_level = title_to_level.get(node.title)
-            assert expected_level is not None, f"Unexpected node title: {node.title}"
-            assert node.level.value == expected_level, \
-                f"Heading '{node.title}' should be H{expected_level}, got H{node.level.value}"
-    finally:
-        os.unlink(path)
+    parser = DocumentParser()
+    tree = parser.parse(doc_stream)
+    
+    # Collect all nodes from tree in order (pre-order traversal)
+    all_nodes = collect_nodes(tree.root_nodes)
+    
+    # Verify we got the right number of headings
+    assert len(all_nodes) == len(unique_headings), \
+        f"Expected {len(unique_headings)} nodes, got {len(all_nodes)}"
+    
+    # Verify each heading level is correctly identified by title
+    title_to_level = {title: level for level, title in unique_headings}
+    
+    for node in all_nodes:
+        expected_level = title_to_level.get(node.title)
+        assert expected_level is not None, f"Unexpected node title: {node.title}"
+        assert node.level.value == expected_level, \
+            f"Heading '{node.title}' should be H{expected_level}, got H{node.level.value}"
 
 
 # Strategy for generating paragraphs under headings
@@ -118,7 +113,6 @@ paragraphs_count = st.integers(min_value=1, max_value=3)
     headings=st.lists(heading_entry, min_size=1, max_size=5),
     para_count=paragraphs_count
 )
-@settings(max_examples=100)
 def test_paragraph_attribution(headings: List[Tuple[int, str]], para_count: int):
     """
     Feature: knowledge-atomizer
@@ -129,47 +123,28 @@ def test_paragraph_attribution(headings: List[Tuple[int, str]], para_count: int)
     attributed to exactly one heading (the nearest preceding heading),
     and no paragraph shall be orphaned.
     """
-    # Filter out empty titles
-    headings = [(level, title.strip()) for level, title in headings if title.strip()]
-    assume(len(headings) > 0)
-    
     # Create test document with paragraphs
-    path = create_test_document(headings, paragraphs_per_heading=para_count)
+    doc_stream = create_test_document(headings, paragraphs_per_heading=para_count)
     
-    try:
-        parser = DocumentParser()
-        tree = parser.parse(path)
-        
-        # Collect all nodes
-        def collect_nodes(nodes: List[DocumentNode]) -> List[DocumentNode]:
-            result = []
-            for node in nodes:
-                result.append(node)
-                result.extend(collect_nodes(node.children))
-            return result
-        
-        all_nodes = collect_nodes(tree.root_nodes)
+    parser = DocumentParser()
+    tree = parser.parse(doc_stream)
+    
+    # Collect all nodes
+    all_nodes = collect_nodes(tree.root_nodes)
+    
+    # Each heading should have content (the paragraphs)
+    for node in all_nodes:
+        # Content should not be empty since we added paragraphs
+        assert node.content, f"Node '{node.title}' should have content"
         
-        # Each heading should have content (the paragraphs)
-        for node in all_nodes:
-            # Content should not be empty since we added paragraphs
-            assert node.content, f"Node '{node.title}' should have content"
-            
-            # Content should contain the expected paragraph text
-            for i in range(para_count):
-                expected_text = f"Content paragraph {i+1} under {node.title}"
-                assert expected_text in node.content, \
-                    f"Node '{node.title}' should contain '{expected_text}'"
-    finally:
-        os.unlink(path)
+        # Content should contain the expected paragraph text
+        for i in range(para_count):
+            expected_text = f"Content paragraph {i+1} under {node.title}"
+            assert expected_text in node.content, \
+                f"Node '{node.title}' should contain '{expected_text}'"
 
 
-# Strategies for invalid files
-invalid_extensions = st.sampled_from(['.txt', '.pdf', '.doc', '.xlsx', '.pptx', ''])
-
-
-@given(ext=invalid_extensions)
-@settings(max_examples=100)
+@pytest.mark.parametrize("ext", ['.txt', '.pdf', '.doc', '.xlsx', '.pptx', ''])
 def test_invalid_file_rejection(ext: str):
     """
     Feature: knowledge-atomizer
@@ -219,8 +194,8 @@ def test_nonexistent_file_rejection():
 
 
 # Helper to create document with table
-def create_document_with_table(rows: int, cols: int, cell_data: List[List[str]]) -> str:
-    """Create a test .docx file with a table under a heading.
+def create_document_with_table(rows: int, cols: int, cell_data: List[List[str]]) -> io.BytesIO:
+    """Create an in-memory test .docx with a table under a heading.
     
     Args:
         rows: Number of rows
@@ -228,9 +203,9 @@ def create_document_with_table(rows: int, cols: int, cell_data: List[List[str]])
         cell_data: 2D list of cell contents
         
     Returns:
-        Path to the created temporary file
+        In-memory .docx stream positioned at the start
     """
-    doc = Document()
+    doc = Document(io.BytesIO(_TEMPLATE_BYTES))
     doc.add_heading("Table Section", level=1)
     
     table = doc.add_table(rows=rows, cols=cols)
@@ -240,28 +215,33 @@ def create_document_with_table(rows: int, cols: int, cell_data: List[List[str]])
                 if j < cols:
                     table.rows[i].cells[j].text = cell_text
     
-    fd, path = tempfile.mkstemp(suffix='.docx')
-    os.close(fd)
-    doc.save(path)
-    return path
+    buf = io.BytesIO()
+    doc.save(buf)
+    buf.seek(0)
+    return buf
 
 
 # Strategy for table dimensions and content
 table_rows = st.integers(min_value=1, max_value=5)
 table_cols = st.integers(min_value=1, max_value=5)
-cell_content = st.text(min_size=0, max_size=20, alphabet=st.characters(
-    whitelist_categories=('L', 'N'),
-    whitelist_characters=' '
-))
+cell_content = st.text(min_size=0, max_size=20, alphabet=ascii_alnum_space)
 
 
-@given(
-    rows=table_rows,
-    cols=table_cols,
-    data=st.data()
-)
-@settings(max_examples=100)
-def test_table_to_markdown_conversion(rows: int, cols: int, data):
+@st.composite
+def table_strategy(draw):
+    """Generate table dimensions with a matching grid of cell contents."""
+    rows = draw(table_rows)
+    cols = draw(table_cols)
+    cell_data = draw(st.lists(
+        st.lists(cell_content, min_size=cols, max_size=cols),
+        min_size=rows,
+        max_size=rows
+    ))
+    return rows, cols, cell_data
+
+
+@given(table=table_strategy())
+def test_table_to_markdown_conversion(table: Tuple[int, int, List[List[str]]]):
     """
     Feature: knowledge-atomizer
     Property 2: Table to Markdown Conversion
@@ -270,46 +250,36 @@ def test_table_to_markdown_conversion(rows: int, cols: int, data):
     For any Word table, converting it to Markdown should produce a table
     with the same number of rows and columns, and equivalent cell content.
     """
-    # Generate cell data
-    cell_data = []
-    for i in range(rows):
-        row_data = []
-        for j in range(cols):
-            cell_text = data.draw(cell_content)
-            row_data.append(cell_text)
-        cell_data.append(row_data)
+    rows, cols, cell_data = table
     
     # Create document with table
-    path = create_document_with_table(rows, cols, cell_data)
+    doc_stream = create_document_with_table(rows, cols, cell_data)
     
-    try:
-        parser = DocumentParser()
-        tree = parser.parse(path)
-        
-        # Get the node with the table
-        assert len(tree.root_nodes) == 1
-        node = tree.root_nodes[0]
-        
-        # Parse the markdown table
-        content = node.content
-        assert content, "Node should have table content"
-        
-        lines = [l for l in content.strip().split('\n') if l.strip()]
-        
-        # Should have header + separator + data rows
-        expected_lines = 1 + 1 + (rows - 1)  # header, separator, data rows
-        assert len(lines) >= expected_lines, \
-            f"Expected at least {expected_lines} lines, got {len(lines)}"
-        
-        # Verify column count by counting pipes in header
-        header_cols = lines[0].count('|') - 1  # pipes minus outer ones
-        assert header_cols == cols, f"Expected {cols} columns, got {header_cols}"
-        
-        # Verify cell content is preserved (check first row as header)
-        for j, expected_text in enumerate(cell_data[0]):
-            expected_clean = expected_text.strip()
-            if expected_clean:
-                assert expected_clean in content, \
-                    f"Cell content '{expected_clean}' should be in markdown"
-    finally:
-        os.unlink(path)
+    parser = DocumentParser()
+    tree = parser.parse(doc_stream)
+    
+    # Get the node with the table
+    assert len(tree.root_nodes) == 1
+    node = tree.root_nodes[0]
+    
+    # Parse the markdown table
+    content = node.content
+    assert content, "Node should have table content"
+    
+    lines = [l for l in content.strip().split('\n') if l.strip()]
+    
+    # Should have header + separator + data rows
+    expected_lines = 1 + 1 + (rows - 1)  # header, separator, data rows
+    assert len(lines) >= expected_lines, \
+        f"Expected at least {expected_lines} lines, got {len(lines)}"
+    
+    # Verify column count by counting pipes in header
+    header_cols = lines[0].count('|') - 1  # pipes minus outer ones
+    assert header_cols == cols, f"Expected {cols} columns, got {header_cols}"
+    
+    # Verify cell content is preserved (check first row as header)
+    for j, expected_text in enumerate(cell_data[0]):
+        expected_clean = expected_text.strip()
+        if expected_clean:
+            assert expected_clean in content, \
+                f"Cell content '{expected_clean}' should be in markdown"
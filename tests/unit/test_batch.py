@@ -0,0 +1,40 @@
+"""Unit tests for parallel multi-file parsing.
+
+Feature: knowledge-atomizer
+"""
+
+import pytest
+
+from src.batch import parse_many
+from src.parser import InvalidFileFormatError
+
+
+def test_parse_many_preserves_input_order(tmp_path):
+    """Trees come back in the order of the given paths."""
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"doc{i}.md"
+        path.write_text(f"# Title {i}\n\nBody {i}\n", encoding='utf-8')
+        paths.append(str(path))
+
+    trees = parse_many(paths, workers=2)
+
+    assert [tree.source_file for tree in trees] == [f"doc{i}.md" for i in range(5)]
+    for i, tree in enumerate(trees):
+        assert len(tree.root_nodes) == 1
+        assert tree.root_nodes[0].title == f"Title {i}"
+        assert tree.root_nodes[0].content == f"Body {i}"
+
+
+def test_parse_many_empty():
+    """No paths means no work and no pool."""
+    assert parse_many([]) == []
+
+
+def test_parse_many_propagates_parser_errors(tmp_path):
+    """Errors raised in a worker surface to the caller."""
+    path = tmp_path / "notes.txt"
+    path.write_text("not a document", encoding='utf-8')
+
+    with pytest.raises(InvalidFileFormatError):
+        parse_many([str(path)], workers=1)